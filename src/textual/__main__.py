@@ -1,9 +1,10 @@
 from rich import print
 from rich.panel import Panel
 
-from textual.demo.demo_app import DemoApp
+from textual.demo.demo_app import DemoApp, install_uvloop
 
 if __name__ == "__main__":
+    install_uvloop()
     app = DemoApp()
     app.run()
     print(
@@ -53,6 +53,8 @@ TRANSPARENT_STYLE = Style()
 """A null style."""
 
 _re_whitespace = re.compile(r"\s+$")
+_span_sort_key = itemgetter(0, 1)
+"""Sort key for (offset, closing, style) span tuples, hoisted from hot paths."""
 _STRIP_CONTROL_CODES: Final = [
     7,  # Bell
     8,  # Backspace
@@ -211,7 +213,7 @@ class Content(Visual):
             *((span.end, True, span.style) for span in self._spans),
             (len(plain), True, None),
         ]
-        markup_spans.sort(key=itemgetter(0, 1))
+        markup_spans.sort(key=_span_sort_key)
         position = 0
         append = output.append
         for offset, closing, style in markup_spans:
@@ -1383,7 +1385,7 @@ class Content(Visual):
             *((span.end, True, index) for index, span in enumerated_spans),
             (len(text), True, 0),
         ]
-        spans.sort(key=itemgetter(0, 1))
+        spans.sort(key=_span_sort_key)
 
         stack: list[int] = []
         stack_append = stack.append
@@ -1,5 +1,6 @@
-from textual.demo.demo_app import DemoApp
+from textual.demo.demo_app import DemoApp, install_uvloop
 
 if __name__ == "__main__":
+    install_uvloop()
     app = DemoApp()
     app.run()
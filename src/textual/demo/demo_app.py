@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import sys
+
 from textual.app import App
 from textual.binding import Binding
 from textual.demo.game import GameScreen
@@ -8,6 +10,22 @@ from textual.demo.projects import ProjectsScreen
 from textual.demo.widgets import WidgetsScreen
 
 
+def install_uvloop() -> None:
+    """Use uvloop if it is available, for faster async I/O.
+
+    uvloop is not a dependency (and doesn't support Windows); this is a no-op
+    when it isn't installed.
+    """
+    if sys.platform == "win32":
+        return
+    try:
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        uvloop.install()
+
+
 class DemoApp(App):
     """The demo app defines the modes and sets a few bindings."""
 
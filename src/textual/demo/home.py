@@ -2,13 +2,9 @@ from __future__ import annotations
 
 import asyncio
 from importlib.metadata import version
+from typing import TYPE_CHECKING
 
-try:
-    import httpx
-
-    HTTPX_AVAILABLE = True
-except ImportError:
-    HTTPX_AVAILABLE = False
+from markdown_it import MarkdownIt
 
 from textual import work
 from textual.app import ComposeResult
@@ -17,6 +13,11 @@ from textual.demo.page import PageScreen
 from textual.reactive import reactive
 from textual.widgets import Collapsible, Digits, Footer, Label, Markdown
 
+if TYPE_CHECKING:
+    import httpx
+    from markdown_it.token import Token
+    from markdown_it.utils import EnvType
+
 WHAT_IS_TEXTUAL_MD = """\
 # What is Textual?
 
@@ -141,9 +142,106 @@ with zero configuration. Even behind a firewall.
 """
 
 
+_HTTPX_CLIENT: httpx.AsyncClient | None = None
+"""Long-lived HTTP client, so repeat refreshes reuse the connection."""
+
+
+def _get_httpx_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client, creating it on first use."""
+    global _HTTPX_CLIENT
+    if _HTTPX_CLIENT is None:
+        import httpx
+
+        _HTTPX_CLIENT = httpx.AsyncClient()
+    return _HTTPX_CLIENT
+
+
+class _CachingMarkdownParser(MarkdownIt):
+    """A markdown-it parser which caches the token stream per document.
+
+    The home screen's markdown is static, so there is no point re-tokenizing
+    it every time the widgets are (re)composed.
+    """
+
+    def __init__(self) -> None:
+        super().__init__("gfm-like")
+        self._token_cache: dict[str, list[Token]] = {}
+
+    def parse(self, src: str, env: EnvType | None = None) -> list[Token]:
+        tokens = self._token_cache.get(src)
+        if tokens is None:
+            tokens = self._token_cache[src] = super().parse(src, env)
+        return tokens
+
+
+_CACHING_PARSER = _CachingMarkdownParser()
+
+# Tokenize the static documents up front, so that the first visit to the
+# home screen doesn't pay for markdown parsing.
+for _markdown in (WHAT_IS_TEXTUAL_MD, WELCOME_MD, ABOUT_MD, API_MD, DEPLOY_MD):
+    _CACHING_PARSER.parse(_markdown)
+del _markdown
+
+
+class CachedMarkdown(Markdown):
+    """A Markdown widget which caches the parsed document, keyed on its source."""
+
+    def __init__(
+        self,
+        markdown: str,
+        *,
+        name: str | None = None,
+        id: str | None = None,
+        classes: str | None = None,
+    ) -> None:
+        super().__init__(
+            markdown,
+            name=name,
+            id=id,
+            classes=classes,
+            parser_factory=lambda: _CACHING_PARSER,
+        )
+
+
+class LazyMarkdownCollapsible(Collapsible):
+    """A collapsible which creates its markdown contents on first expansion.
+
+    Documents inside a collapsed section don't need to be built (or parsed)
+    until the user actually expands them.
+    """
+
+    def __init__(self, markdown: str, *, title: str, collapsed: bool = True) -> None:
+        """Initialize a LazyMarkdownCollapsible.
+
+        Args:
+            markdown: String containing Markdown, built on first expansion.
+            title: Title of the collapsed/expanded contents.
+            collapsed: Default status of the contents.
+        """
+        super().__init__(title=title, collapsed=collapsed)
+        self._markdown = markdown
+        self._markdown_mounted = False
+
+    def _mount_markdown(self) -> None:
+        """Mount the markdown contents, if they aren't already mounted."""
+        if not self._markdown_mounted:
+            self._markdown_mounted = True
+            self.query_one(self.Contents).mount(CachedMarkdown(self._markdown))
+
+    def on_mount(self) -> None:
+        if not self.collapsed:
+            self._mount_markdown()
+
+    def watch_collapsed(self, collapsed: bool) -> None:
+        if not collapsed and self.is_mounted:
+            self._mount_markdown()
+
+
 class StarCount(Vertical):
     """Widget to get and display GitHub star count."""
 
+    __slots__ = ["_stars_digits", "_forks_digits"]
+
     DEFAULT_CSS = """
     StarCount {
         dock: top;
@@ -164,13 +262,16 @@ class StarCount(Vertical):
         &>Horizontal { max-width: 100;} 
     }
     """
-    stars = reactive(25251, recompose=True)
-    forks = reactive(776, recompose=True)
+    stars = reactive(25251)
+    forks = reactive(776)
 
     @work
     async def get_stars(self):
         """Worker to get stars from GitHub API."""
-        if not HTTPX_AVAILABLE:
+        try:
+            # httpx is imported lazily, so apps that never refresh don't pay for it
+            client = _get_httpx_client()
+        except ImportError:
             self.notify(
                 "Install httpx to update stars from the GitHub API.\n\n$ [b]pip install httpx[/b]",
                 title="GitHub Stars",
@@ -178,11 +279,11 @@ class StarCount(Vertical):
             return
         self.loading = True
         try:
-            await asyncio.sleep(1)  # Time to admire the loading indicator
-            async with httpx.AsyncClient() as client:
-                repository_json = (
-                    await client.get("https://api.github.com/repos/textualize/textual")
-                ).json()
+            response, _ = await asyncio.gather(
+                client.get("https://api.github.com/repos/textualize/textual"),
+                asyncio.sleep(1),  # Time to admire the loading indicator
+            )
+            repository_json = response.json()
             self.stars = repository_json["stargazers_count"]
             self.forks = repository_json["forks"]
         except Exception:
@@ -194,17 +295,34 @@ class StarCount(Vertical):
         self.loading = False
 
     def compose(self) -> ComposeResult:
+        self._stars_digits = Digits(f"{self.stars / 1000:.1f}K").with_tooltip(
+            f"{self.stars} GitHub stars"
+        )
+        self._forks_digits = Digits(str(self.forks)).with_tooltip(f"{self.forks} Forks")
         with Horizontal():
             with Vertical(id="version"):
                 yield Label("Version")
                 yield Digits(version("textual"))
             with Vertical(id="stars"):
                 yield Label("GitHub ★")
-                stars = f"{self.stars / 1000:.1f}K"
-                yield Digits(stars).with_tooltip(f"{self.stars} GitHub stars")
+                yield self._stars_digits
             with Vertical(id="forks"):
                 yield Label("Forks")
-                yield Digits(str(self.forks)).with_tooltip(f"{self.forks} Forks")
+                yield self._forks_digits
+
+    def watch_stars(self, stars: int) -> None:
+        """Update the stars display in place, rather than recompose."""
+        if not self.is_mounted:
+            return
+        self._stars_digits.update(f"{stars / 1000:.1f}K")
+        self._stars_digits.tooltip = f"{stars} GitHub stars"
+
+    def watch_forks(self, forks: int) -> None:
+        """Update the forks display in place, rather than recompose."""
+        if not self.is_mounted:
+            return
+        self._forks_digits.update(str(forks))
+        self._forks_digits.tooltip = f"{forks} Forks"
 
     def on_mount(self) -> None:
         self.tooltip = "Click to refresh"
@@ -251,13 +369,10 @@ class HomeScreen(PageScreen):
     def compose(self) -> ComposeResult:
         yield StarCount()
         with Content():
-            yield Markdown(WHAT_IS_TEXTUAL_MD)
+            yield CachedMarkdown(WHAT_IS_TEXTUAL_MD)
             with Collapsible(title="Welcome", collapsed=False):
-                yield Markdown(WELCOME_MD)
-            with Collapsible(title="Textual Interfaces"):
-                yield Markdown(ABOUT_MD)
-            with Collapsible(title="Textual API"):
-                yield Markdown(API_MD)
-            with Collapsible(title="Deploying Textual apps"):
-                yield Markdown(DEPLOY_MD)
+                yield CachedMarkdown(WELCOME_MD)
+            yield LazyMarkdownCollapsible(ABOUT_MD, title="Textual Interfaces")
+            yield LazyMarkdownCollapsible(API_MD, title="Textual API")
+            yield LazyMarkdownCollapsible(DEPLOY_MD, title="Deploying Textual apps")
         yield Footer()
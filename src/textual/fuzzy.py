@@ -18,6 +18,9 @@ from textual.cache import LRUCache
 from textual.content import Content
 from textual.visual import Style
 
+_score_key = itemgetter(0)
+"""Sort key to extract the score from a (score, offsets) pair."""
+
 
 class FuzzySearch:
     """Performs a fuzzy search.
@@ -55,7 +58,7 @@ class FuzzySearch:
         if cache_key in self.cache:
             return self.cache[cache_key]
         default: tuple[float, Sequence[int]] = (0.0, [])
-        result = max(self._match(query, candidate), key=itemgetter(0), default=default)
+        result = max(self._match(query, candidate), key=_score_key, default=default)
         self.cache[cache_key] = result
         return result
 
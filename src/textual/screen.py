@@ -493,6 +493,22 @@ class Screen(Generic[ScreenResultType], Widget):
 
         return bindings_map
 
+    @property
+    def active_bindings_grouped(self) -> dict[DOMNode, list[ActiveBinding]]:
+        """Get currently active bindings, grouped by the node where they are defined.
+
+        Namespaces appear in the order in which they first supply a binding, and
+        each namespace's bindings preserve the order of
+        [active_bindings][textual.screen.Screen.active_bindings].
+
+        Returns:
+            A map of nodes on to the bindings they supply.
+        """
+        grouped: dict[DOMNode, list[ActiveBinding]] = {}
+        for active_binding in self.active_bindings.values():
+            grouped.setdefault(active_binding.node, []).append(active_binding)
+        return grouped
+
     def arrange(self, size: Size, _optimal: bool = False) -> DockArrangeResult:
         """Arrange children.
 
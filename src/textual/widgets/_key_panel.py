@@ -1,8 +1,5 @@
 from __future__ import annotations
 
-from collections import defaultdict
-from itertools import groupby
-from operator import itemgetter
 from typing import TYPE_CHECKING
 
 from rich import box
@@ -11,13 +8,46 @@ from rich.text import Text
 
 from textual.app import ComposeResult
 from textual.binding import Binding
+from textual.cache import LRUCache
 from textual.containers import VerticalScroll
+from textual.dom import NoScreen
 from textual.widgets import Static
 
 if TYPE_CHECKING:
+    from rich.style import Style
+
     from textual.screen import Screen
 
 
+_description_cache: LRUCache[tuple[str, str, Style], Text] = LRUCache(1024)
+"""Maps (description, tooltip, style) on to parsed description text."""
+
+_EMPTY_TABLE = Table(padding=(0, 0), show_header=False, box=box.SIMPLE)
+"""Shared empty table, rendered when a screen has no active bindings."""
+
+
+def _render_description(binding: Binding, description_style: Style) -> Text:
+    """Render description text from a binding.
+
+    Args:
+        binding: The binding to render the description of.
+        description_style: Base style to apply to the description.
+
+    Returns:
+        Description text, with any tooltip appended.
+    """
+    cache_key = (binding.description, binding.tooltip, description_style)
+    text = _description_cache.get(cache_key)
+    if text is None:
+        text = Text.from_markup(binding.description, end="", style=description_style)
+        if binding.tooltip:
+            if binding.description:
+                text.append(" ")
+            text.append(binding.tooltip, "dim")
+        _description_cache[cache_key] = text
+    return text.copy()
+
+
 class BindingsTable(Static):
     """A widget to display bindings."""
 
@@ -35,6 +65,31 @@ class BindingsTable(Static):
     }
     """
 
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._bindings_fingerprint: object = None
+        """Fingerprint of the bindings (and styles) most recently rendered."""
+        self._bindings_table: Table | None = None
+        """Cached table, valid while the fingerprint is unchanged."""
+        self._key_display_cache: dict[tuple[str, str | None], str] = {}
+        """Maps (key, key_display) on to the key's display string."""
+
+    def _get_key_display(self, binding: Binding) -> str:
+        """Get the display string for a binding's key, via a cache.
+
+        Args:
+            binding: A binding.
+
+        Returns:
+            A string used to represent the key.
+        """
+        cache_key = (binding.key, binding.key_display)
+        key_display = self._key_display_cache.get(cache_key)
+        if key_display is None:
+            key_display = self.app.get_key_display(binding)
+            self._key_display_cache[cache_key] = key_display
+        return key_display
+
     def render_bindings_table(self) -> Table:
         """Render a table with all the key bindings.
 
@@ -42,75 +97,87 @@ class BindingsTable(Static):
             A Rich Table.
         """
 
-        bindings = self.screen.active_bindings.values()
+        grouped_bindings = self.screen.active_bindings_grouped
+        if not grouped_bindings:
+            # Brief state during screen transitions; skip building a table
+            return _EMPTY_TABLE
 
         key_style = self.get_component_rich_style("bindings-table--key")
+        description_style = self.get_component_rich_style("bindings-table--description")
+        header_style = self.get_component_rich_style("bindings-table--header")
+        divider_style = self.get_component_rich_style("bindings-table--divider")
         divider_transparent = (
             self.get_component_styles("bindings-table--divider").color.a == 0
         )
+
+        fingerprint = (
+            (key_style, description_style, header_style, divider_style),
+            tuple(
+                (
+                    namespace,
+                    binding.key,
+                    binding.key_display,
+                    binding.action,
+                    binding.description,
+                    binding.system,
+                    enabled,
+                    tooltip,
+                )
+                for namespace, entries in grouped_bindings.items()
+                for _, binding, enabled, tooltip in entries
+            ),
+        )
+        if fingerprint == self._bindings_fingerprint:
+            assert self._bindings_table is not None
+            return self._bindings_table
+
         table = Table(
             padding=(0, 0),
             show_header=False,
             box=box.SIMPLE if divider_transparent else box.HORIZONTALS,
-            border_style=self.get_component_rich_style("bindings-table--divider"),
+            border_style=divider_style,
         )
-        table.add_column("", justify="right")
+        table.add_column("", justify="right", style=key_style)
 
-        header_style = self.get_component_rich_style("bindings-table--header")
-        previous_namespace: object = None
-        for namespace, _bindings in groupby(bindings, key=itemgetter(0)):
-            table_bindings = list(_bindings)
-            if not table_bindings:
+        get_key_display = self._get_key_display
+        for namespace, entries in grouped_bindings.items():
+            # Group this namespace's bindings by action in a single pass
+            action_to_bindings: dict[str, list[Binding]] = {}
+            for _, binding, _enabled, _tooltip in entries:
+                if not binding.system:
+                    action_to_bindings.setdefault(binding.action, []).append(binding)
+            if not action_to_bindings:
                 continue
 
+            if table.rows:
+                # Add a divider between groups (not after the last one)
+                table.add_section()
+
             if namespace.BINDING_GROUP_TITLE:
                 title = Text(namespace.BINDING_GROUP_TITLE, end="")
                 title.stylize(header_style)
                 table.add_row("", title)
 
-            action_to_bindings: defaultdict[str, list[tuple[Binding, bool, str]]]
-            action_to_bindings = defaultdict(list)
-            for _, binding, enabled, tooltip in table_bindings:
-                if not binding.system:
-                    action_to_bindings[binding.action].append(
-                        (binding, enabled, tooltip)
-                    )
-
-            description_style = self.get_component_rich_style(
-                "bindings-table--description"
-            )
-
-            def render_description(binding: Binding) -> Text:
-                """Render description text from a binding."""
-                text = Text.from_markup(
-                    binding.description, end="", style=description_style
-                )
-                if binding.tooltip:
-                    if binding.description:
-                        text.append(" ")
-                    text.append(binding.tooltip, "dim")
-                return text
-
-            get_key_display = self.app.get_key_display
             for multi_bindings in action_to_bindings.values():
-                binding, enabled, tooltip = multi_bindings[0]
+                binding = multi_bindings[0]
                 keys_display = " ".join(
                     dict.fromkeys(  # Remove duplicates while preserving order
-                        get_key_display(binding) for binding, _, _ in multi_bindings
+                        get_key_display(binding) for binding in multi_bindings
                     )
                 )
                 table.add_row(
-                    Text(keys_display, style=key_style),
-                    render_description(binding),
+                    keys_display,
+                    _render_description(binding, description_style),
                 )
-            if namespace != previous_namespace:
-                table.add_section()
-
-            previous_namespace = namespace
 
+        self._bindings_fingerprint = fingerprint
+        self._bindings_table = table
         return table
 
     def render(self) -> Table:
+        if not self.app.app_focus and self._bindings_table is not None:
+            # The app isn't focused, so the last rendered table will do
+            return self._bindings_table
         return self.render_bindings_table()
 
 
@@ -164,19 +231,34 @@ class KeyPanel(VerticalScroll, can_focus=False):
 
     async def on_mount(self) -> None:
         mount_screen = self.screen
+        self._refresh_pending = False
 
-        async def bindings_changed(screen: Screen) -> None:
+        def bindings_changed(screen: Screen) -> None:
             """Update bindings."""
+            self._refresh_pending = False
             if not screen.app.app_focus:
                 return
             if self.is_attached and screen is mount_screen:
-                await self.recompose()
+                self.query_one(BindingsTable).refresh(layout=True)
 
         def _bindings_changed(screen: Screen) -> None:
+            """Schedule a refresh, coalescing bursts of updates into one."""
+            if self._refresh_pending:
+                return
+            self._refresh_pending = True
             self.call_after_refresh(bindings_changed, screen)
 
         self.set_class(self.app.ansi_color, "-ansi-scrollbar")
         self.screen.bindings_updated_signal.subscribe(self, _bindings_changed)
+        self._subscribed = True
 
     def on_unmount(self) -> None:
-        self.screen.bindings_updated_signal.unsubscribe(self)
+        if not getattr(self, "_subscribed", False):
+            # Never subscribed (or already unsubscribed), nothing to do
+            return
+        self._subscribed = False
+        try:
+            screen = self.screen
+        except NoScreen:
+            return
+        screen.bindings_updated_signal.unsubscribe(self)
@@ -2,7 +2,7 @@ from string import ascii_lowercase
 
 import pytest
 
-from textual.app import App
+from textual.app import App, ComposeResult
 from textual.binding import (
     Binding,
     BindingError,
@@ -11,6 +11,7 @@ from textual.binding import (
     NoBinding,
 )
 from textual.screen import Screen
+from textual.widgets import Static
 
 BINDING1 = Binding("a,b", action="action1", description="description1")
 BINDING2 = Binding("c", action="action2", description="description2")
@@ -137,3 +138,33 @@ async def test_keymap_key() -> None:
         assert app._keymap == {"foo": "question_mark,space"}
         app.update_keymap({"bar": "$"})
         assert app._keymap == {"bar": "dollar_sign", "foo": "question_mark,space"}
+
+
+async def test_active_bindings_grouped() -> None:
+    """Check bindings are grouped by node, preserving active_bindings order."""
+
+    class Focusable(Static, can_focus=True):
+        BINDINGS = [Binding("x", "example", "Example")]
+
+    class GroupedApp(App):
+        BINDINGS = [Binding("q", "quit", "Quit")]
+
+        def compose(self) -> ComposeResult:
+            yield Focusable()
+
+    app = GroupedApp()
+    async with app.run_test() as pilot:
+        app.query_one(Focusable).focus()
+        await pilot.pause()
+        active_bindings = app.screen.active_bindings
+        grouped = app.screen.active_bindings_grouped
+        assert len(grouped) > 1
+        # Each group contains only the bindings supplied by its node
+        for node, bindings in grouped.items():
+            assert all(active_binding.node is node for active_binding in bindings)
+        # Flattening the groups preserves active_bindings order
+        assert [
+            active_binding
+            for bindings in grouped.values()
+            for active_binding in bindings
+        ] == list(active_bindings.values())